@@ -3,7 +3,9 @@ import numpy as np
 import ctypes
 
 import System
+from System import IntPtr
 from System.Runtime.InteropServices import GCHandle, GCHandleType
+from System.Runtime.InteropServices import Marshal
 
 _MAP_NP_NET = {
     np.dtype("float32"): System.Single,
@@ -32,15 +34,53 @@ _MAP_NET_NP = {
     "Boolean": np.dtype("bool"),
 }
 
+# .NET array element types, which have a Marshal.Copy overload
+# for copying the array into unmanaged memory.
+_MARSHAL_COPY_TYPES = {"Single", "Double", "Int16", "Int32", "Int64", "Byte"}
+
+# Number of .NET ticks (100 nanoseconds) between 0001-01-01 and 1970-01-01.
+_DOTNET_TICKS_AT_UNIX_EPOCH = 621355968000000000
+_DOTNET_TICKS_PER_SECOND = 10000000
+_DOTNET_TICKS_PER_MICROSECOND = 10
+
 
 def to_dotnet_datetime(x):
     """Convert from python datetime to .NET System.DateTime """
-    return System.DateTime(x.year, x.month, x.day, x.hour, x.minute, x.second,)
+    dotnet_datetime = System.DateTime(x.year, x.month, x.day, x.hour, x.minute, x.second,)
+    return dotnet_datetime.AddTicks(x.microsecond * _DOTNET_TICKS_PER_MICROSECOND)
 
 
 def from_dotnet_datetime(x):
-    """Convert from .NET System.DateTime to python datetime"""
-    return datetime.datetime(x.Year, x.Month, x.Day, x.Hour, x.Minute, x.Second)
+    """
+    Convert from .NET System.DateTime to python datetime.
+    The time is truncated to whole microseconds.
+    """
+    microsecond = (x.Ticks % _DOTNET_TICKS_PER_SECOND) // _DOTNET_TICKS_PER_MICROSECOND
+    return datetime.datetime(x.Year, x.Month, x.Day, x.Hour, x.Minute, x.Second, microsecond)
+
+
+def from_dotnet_datetimes(x):
+    """
+    Convert a collection of .NET System.DateTime to numpy datetime64 array
+
+    Parameters
+    ----------
+    x : IEnumerable of System.DateTime
+
+    Returns
+    -------
+    np.ndarray
+        Array of dtype datetime64[ns].
+
+    Notes
+    -----
+    Only the Ticks property is accessed for every System.DateTime,
+    the conversion to datetime64 is then done on the whole array.
+    The times are truncated to whole microseconds like in from_dotnet_datetime.
+    """
+    ticks = np.fromiter((t.Ticks for t in x), dtype=np.int64)
+    microseconds = (ticks - _DOTNET_TICKS_AT_UNIX_EPOCH) // _DOTNET_TICKS_PER_MICROSECOND
+    return (microseconds * 1000).astype("datetime64[ns]")
 
 
 def asNumpyArray(x):
@@ -138,31 +178,46 @@ def to_dotnet_float_array(x):
     return to_dotnet_array(x.astype(np.float32))
 
 
-def to_numpy(src):
+def to_numpy(src, out=None):
     """
     Convert .NET array to numpy array
 
     Parameters
     ----------
     src : System.Array
+        One dimensional .NET array of one of the types in _MARSHAL_COPY_TYPES.
+    out : np.ndarray, optional
+        Contiguous numpy array of the same data type and length as src
+        to copy the values into, for example a column of a Fortran ordered 2D array.
+        By default a new array is allocated.
 
     Returns
     -------
     np.ndarray
 
+    Notes
+    -----
+    The values of the .NET array are copied in a single Marshal.Copy call,
+    so the returned array does not reference .NET memory. The data type of
+    the numpy array is determined from the .NET array type, see _MAP_NET_NP.
     """
+    net_type = src.GetType().GetElementType().Name
+    if src.Rank != 1 or net_type not in _MARSHAL_COPY_TYPES:
+        raise NotImplementedError(
+            "to_numpy does not yet support System type {} of rank {}".format(net_type, src.Rank)
+        )
 
-    src_hndl = GCHandle.Alloc(src, GCHandleType.Pinned)
-    try:
-        src_ptr = src_hndl.AddrOfPinnedObject().ToInt64()
-        bufType = ctypes.c_float * len(src)
-        cbuf = bufType.from_address(src_ptr)
-        d = np.frombuffer(cbuf, dtype=cbuf._type_)
-    finally:
-        if src_hndl.IsAllocated:
-            src_hndl.Free()
+    dtype = _MAP_NET_NP[net_type]
+    if out is None:
+        out = np.empty(src.Length, dtype=dtype)
+
+    if out.dtype != dtype or not out.flags.c_contiguous or out.size != src.Length:
+        raise ValueError(
+            f"Argument 'out' must be a contiguous {dtype} array of the same length as 'src'."
+        )
 
-    return d
+    Marshal.Copy(src, 0, IntPtr(out.ctypes.data), out.size)
+    return out
 
 
 def pythonnet_implementation(clr_object):
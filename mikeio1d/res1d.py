@@ -1,13 +1,17 @@
 import os.path
+import numpy as np
 import pandas as pd
 import datetime
 
 from .dotnet import from_dotnet_datetime
+from .dotnet import from_dotnet_datetimes
 from .dotnet import to_dotnet_datetime
 from .dotnet import to_numpy
+from .dotnet import asNumpyArray
 from .dotnet import pythonnet_implementation as impl
 
 from .result_extractor import ExtractorAll
+from .result_network import DataEntry
 from .result_network import ResultNetwork
 from .result_network import ResultWriter
 
@@ -104,14 +108,18 @@ class Res1D:
         self._time_index = None
         self._start_time = None
         self._end_time = None
+        self._quantities = None
+        self._quantities_repr = None
+        self._summary_counts_cache = None
 
         self._load_header()
         if not header_load:
             self._load_file()
 
-        self.result_network = ResultNetwork(self)
-        self.result_writer = ResultWriter(self)
-        self._queries = self.result_network.queries
+        # The network and writer are created on first access,
+        # which avoids enumerating the whole network for header_load=True.
+        self._result_network = None
+        self._result_writer = None
 
         self._col_name_delimiter = col_name_delimiter
         self._put_chainage_in_col_name = put_chainage_in_col_name
@@ -123,14 +131,14 @@ class Res1D:
         if self.file_path:
             out.append(f"Start time: {str(self.start_time)}")
             out.append(f"End time: {str(self.end_time)}")
-            out.append(f"# Timesteps: {str(self.data.NumberOfTimeSteps)}")
-            out.append(f"# Catchments: {self.data.Catchments.get_Count()}")
-            out.append(f"# Nodes: {self.data.Nodes.get_Count()}")
-            out.append(f"# Reaches: {self.data.Reaches.get_Count()}")
+            time_step_count, catchment_count, node_count, reach_count, global_count = self._summary_counts()
+            out.append(f"# Timesteps: {str(time_step_count)}")
+            out.append(f"# Catchments: {catchment_count}")
+            out.append(f"# Nodes: {node_count}")
+            out.append(f"# Reaches: {reach_count}")
 
-            out.append(f"# Globals: {self.data.GlobalData.DataItems.Count}")
-            for i, quantity in enumerate(self.data.Quantities):
-                out.append(f"{i} - {quantity.Id} <{quantity.EumQuantity.UnitAbbreviation}>")
+            out.append(f"# Globals: {global_count}")
+            out.extend(self._get_quantities_repr())
 
         return str.join("\n", out)
 
@@ -206,14 +214,63 @@ class Res1D:
         if not self._is_lts_result_file():
             return
 
-        simulation_start = from_dotnet_datetime(self._data.StartTime)
+        simulation_start = self.start_time
         for label in df:
             time_suffix = f'Time{self._col_name_delimiter}'
             if time_suffix in label:
-                seconds_after_simulation_start_array = df[label].to_numpy()
+                seconds_after_simulation_start_array = df[label].to_numpy().tolist()
                 times = [simulation_start + datetime.timedelta(seconds=sec) for sec in seconds_after_simulation_start_array]
                 df[label] = times
 
+    def _summary_counts(self):
+        """
+        Get a tuple of counts used in __repr__: number of time steps,
+        catchments, nodes, reaches and global data items.
+        """
+        if self._summary_counts_cache is not None:
+            return self._summary_counts_cache
+
+        data = self.data
+        self._summary_counts_cache = (
+            data.NumberOfTimeSteps,
+            data.Catchments.get_Count(),
+            data.Nodes.get_Count(),
+            data.Reaches.get_Count(),
+            data.GlobalData.DataItems.Count,
+        )
+        return self._summary_counts_cache
+
+    def _get_quantities_repr(self):
+        """ Get a list of quantity description lines used in __repr__. """
+        if self._quantities_repr is not None:
+            return self._quantities_repr
+
+        quantities = list(self.data.Quantities)
+        self._quantities_repr = [
+            f"{i} - {quantity.Id} <{quantity.EumQuantity.UnitAbbreviation}>"
+            for i, quantity in enumerate(quantities)
+        ]
+        return self._quantities_repr
+
+    def _clear_cached_values(self):
+        """ Clear values cached from ResultData, which could change after modifying it. """
+        self._start_time = None
+        self._end_time = None
+        self._summary_counts_cache = None
+
+    def _read_data_entries(self, data_entries):
+        """
+        Read time series of data entries into columns of a float32 array.
+
+        The array is Fortran ordered, so every column is contiguous and
+        the time series of a data entry is copied directly into it.
+        """
+        data = np.empty((len(self.time_index), len(data_entries)), dtype=np.float32, order='F')
+        for i, data_entry in enumerate(data_entries):
+            values = data_entry.data_item.CreateTimeSeriesData(data_entry.element_index)
+            to_numpy(values, out=data[:, i])
+        return data
+
     def _get_actual_queries(self, queries):
         """ Finds out which list of queries should be used. """
         queries = self._queries if queries is None else queries
@@ -235,6 +292,13 @@ class Res1D:
         queries: A single query or a list of queries.
             Default is None = reads all data.
 
+        Returns
+        -------
+        pandas.DataFrame
+            Data frame with float32 values, which is the precision
+            the values are stored with in the result file.
+            Use df.astype(float) to get float64 values.
+
         Examples
         --------
         An example of reading res1d file with queries:
@@ -253,14 +317,12 @@ class Res1D:
 
         queries = self._get_actual_queries(queries)
 
-        dfs = []
-        for query in queries:
-            df = pd.DataFrame(index=self.time_index)
-            values = query.get_values(self)
-            df[str(query)] = values
-            dfs.append(df)
+        data = np.empty((len(self.time_index), len(queries)), dtype=np.float32, order='F')
+        for i, query in enumerate(queries):
+            data[:, i] = query.get_values(self)
 
-        df = pd.concat(dfs, axis=1)
+        col_names = [str(query) for query in queries]
+        df = pd.DataFrame(data, index=self.time_index, columns=col_names)
         self._update_time_quantities(df)
 
         if self.clear_queries_after_reading:
@@ -269,9 +331,10 @@ class Res1D:
         return df
 
     def read_all(self):
-        """ Read all data from res1d file to dataframe. """
+        """ Read all data from res1d file to dataframe with float32 values. """
 
-        dfs = []
+        data_entries = []
+        col_names = []
         for data_set in self.data.DataSets:
 
             data_set = impl(data_set)
@@ -282,50 +345,69 @@ class Res1D:
                 continue
 
             for data_item in data_set.DataItems:
-                values_name_pair = self.get_values(data_set, data_item)
+                for data_entry, col_name in self.get_data_entries(data_set, data_item):
+                    data_entries.append(data_entry)
+                    col_names.append(col_name)
 
-                for values, col_name in values_name_pair:
-                    df = pd.DataFrame(index=self.time_index)
-                    df[col_name] = values
-                    dfs.append(df)
+        data = self._read_data_entries(data_entries)
 
-        df = pd.concat(dfs, axis=1)
+        df = pd.DataFrame(data, index=self.time_index, columns=col_names)
         self._update_time_quantities(df)
         return df
 
     def clear_queries(self):
         """ Clear the current active list of queries. """
+        if self._result_network is None:
+            return
+
         self.result_network.queries.clear()
         self.result_network.queries_ids.clear()
 
     def get_values(self, data_set, data_item):
         """ Get all time series values in given data_item. """
+        for data_entry, col_name in self.get_data_entries(data_set, data_item):
+            yield data_item.CreateTimeSeriesData(data_entry.element_index), col_name
+
+    def get_scalar_value(self, data_set, data_item):
+        """ Get time series values and column name of a scalar data_item. """
+        for data_entry, col_name in self.get_scalar_data_entry(data_set, data_item):
+            yield data_item.CreateTimeSeriesData(data_entry.element_index), col_name
+
+    def get_vector_values(self, data_set, data_item):
+        """ Get time series values and column names of all elements in a vector data_item. """
+        for data_entry, col_name in self.get_vector_data_entries(data_set, data_item):
+            yield data_item.CreateTimeSeriesData(data_entry.element_index), col_name
+
+    def get_data_entries(self, data_set, data_item):
+        """ Get all data entries and their column names in given data_item. """
         if data_item.IndexList is None:
-            return self.get_scalar_value(data_set, data_item)
+            return self.get_scalar_data_entry(data_set, data_item)
         else:
-            return self.get_vector_values(data_set, data_item)
+            return self.get_vector_data_entries(data_set, data_item)
 
-    def get_scalar_value(self, data_set, data_item):
+    def get_scalar_data_entry(self, data_set, data_item):
         name = Res1D.get_data_set_name(data_set)
         quantity_id = data_item.Quantity.Id
         col_name = self.get_col_name(quantity_id, name)
         element_index = 0
 
-        yield data_item.CreateTimeSeriesData(element_index), col_name
+        yield DataEntry(data_item, element_index), col_name
 
-    def get_vector_values(self, data_set, data_item):
+    def get_vector_data_entries(self, data_set, data_item):
         name = Res1D.get_data_set_name(data_set)
         item_id = data_item.ItemId
         # Add item id if present before the name.
         # Needed for unique identification of structures.
         name = self._col_name_delimiter.join([item_id, name]) if item_id is not None else name
-        chainages = data_set.GetChainages(data_item)
+        # Copy the chainages and get the quantity ID once,
+        # instead of accessing them via .NET for every element.
+        chainages = asNumpyArray(data_set.GetChainages(data_item)).tolist()
+        quantity_id = data_item.Quantity.Id
 
         for i in range(data_item.NumberOfElements):
-            quantity_id = data_item.Quantity.Id
             col_name_i = self.get_col_name(quantity_id, name, chainages[i], i)
 
-            yield data_item.CreateTimeSeriesData(i), col_name_i
+            yield DataEntry(data_item, i), col_name_i
 
     @staticmethod
     def get_data_set_name(data_set):
@@ -360,7 +442,7 @@ class Res1D:
         if self._is_lts_result_file():
             return self.lts_event_index
 
-        time_stamps = [from_dotnet_datetime(t) for t in self.data.TimesList]
+        time_stamps = from_dotnet_datetimes(self.data.TimesList)
         self._time_index = pd.DatetimeIndex(time_stamps)
         return self._time_index
 
@@ -382,19 +464,25 @@ class Res1D:
         if self._start_time is not None:
             return self._start_time
 
-        return from_dotnet_datetime(self.data.StartTime)
+        self._start_time = from_dotnet_datetime(self.data.StartTime)
+        return self._start_time
 
     @property
     def end_time(self):
         if self._end_time is not None:
             return self._end_time
 
-        return from_dotnet_datetime(self.data.EndTime)
+        self._end_time = from_dotnet_datetime(self.data.EndTime)
+        return self._end_time
 
     @property
     def quantities(self):
         """ Quantities in res1d file. """
-        return [quantity.Id for quantity in self._data.Quantities]
+        if self._quantities is not None:
+            return self._quantities
+
+        self._quantities = [quantity.Id for quantity in self._data.Quantities]
+        return self._quantities
 
     @property
     def query(self):
@@ -416,6 +504,35 @@ class Res1D:
         """
         return self._data
 
+    @property
+    def result_network(self):
+        """ ResultNetwork object wrapping the network of the result file. """
+        if self._result_network is None:
+            # ResultNetwork constructor assigns itself to res1d.result_network.
+            ResultNetwork(self)
+
+        return self._result_network
+
+    @result_network.setter
+    def result_network(self, result_network):
+        self._result_network = result_network
+
+    @property
+    def result_writer(self):
+        """ ResultWriter object used to modify the result data. """
+        if self._result_writer is None:
+            self._result_writer = ResultWriter(self)
+
+        return self._result_writer
+
+    @property
+    def _queries(self):
+        """ Active list of queries, which is empty when the network is not created yet. """
+        if self._result_network is None:
+            return []
+
+        return self._result_network.queries
+
     @property
     def catchments(self):
         """ Catchments in res1d file. """
@@ -482,6 +599,7 @@ class Res1D:
             File path for the new res1d file. Optional.
         """
         self.result_writer.modify(data_frame)
+        self._clear_cached_values()
         if file_path is not None:
             self.save(file_path)
 
@@ -496,6 +614,7 @@ class Res1D:
         """
         self.data.Connection.FilePath.Path = file_path
         self.data.Save()
+        self._clear_cached_values()
 
     def extract(self, file_path, queries=None, time_step_skipping_number=1, ext=None):
         """
@@ -519,6 +638,7 @@ class Res1D:
             Can be 'csv', 'dfs0', 'txt'.
         """
         ext = os.path.splitext(file_path)[-1] if ext is None else ext
+        ext = ext.lstrip('.').lower()
 
         queries = self._get_actual_queries(queries)
         data_entries = self.result_network.convert_queries_to_data_entries(queries)
@@ -6,3 +6,17 @@ class Extractor(object):
         self.output_data = output_data
         self.result_data = result_data
         self.time_step_skipping_number = time_step_skipping_number
+        self.reach_gridpoints_map = {}
+
+    def get_gridpoints(self, reach, reach_index):
+        """
+        Get a list of grid points of a reach.
+
+        The list is created only once per reach, because many
+        data entries typically belong to the same reach.
+        """
+        reach_gridpoints_map = self.reach_gridpoints_map
+        if reach_index not in reach_gridpoints_map:
+            reach_gridpoints_map[reach_index] = list(reach.GridPoints)
+
+        return reach_gridpoints_map[reach_index]
@@ -22,17 +22,20 @@ class ExtractorAll(object):
 
     @staticmethod
     def create(out_file_type, out_file_name, output_data, result_data, time_step_skipping_number=1):
-        extractors = {
-            OutputFileType.TXT: ExtractorTxt,
-            OutputFileType.CSV: ExtractorCsv,
-            OutputFileType.DFS0: ExtractorDfs0,
-            OutputFileType.ALL: ExtractorAll
-        }
-
-        extractor = extractors.get(out_file_type, None)
+        extractor = _EXTRACTORS.get(out_file_type.lower(), None)
+        if extractor is None:
+            raise ValueError(f"Unsupported output file type '{out_file_type}'.")
 
         return extractor(out_file_name, output_data, result_data, time_step_skipping_number)
 
     def export(self):
         for extractor in self.all_extractors:
             extractor.export()
+
+
+_EXTRACTORS = {
+    OutputFileType.TXT: ExtractorTxt,
+    OutputFileType.CSV: ExtractorCsv,
+    OutputFileType.DFS0: ExtractorDfs0,
+    OutputFileType.ALL: ExtractorAll
+}
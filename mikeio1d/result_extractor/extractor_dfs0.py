@@ -41,6 +41,10 @@ class ExtractorDfs0(Extractor):
         result_data = self.result_data
         builder = self.builder
 
+        reaches = list(result_data.Reaches)
+        nodes = list(result_data.Nodes)
+        catchments = list(result_data.Catchments)
+
         for data_entry in output_data:
             data_item = data_entry.data_item
             element_index = data_entry.element_index
@@ -49,14 +53,10 @@ class ExtractorDfs0(Extractor):
             item_type_group = data_item.ItemTypeGroup
             number_within_group = data_item.NumberWithinGroup
 
-            reaches = list(result_data.Reaches)
-            nodes = list(result_data.Nodes)
-            catchments = list(result_data.Catchments)
-
             if item_type_group == ItemTypeGroup.ReachItem:
                 reach = reaches[number_within_group]
                 gridpoint_index = data_item.IndexList[element_index]
-                gridpoints = list(reach.GridPoints)
+                gridpoints = self.get_gridpoints(reach, number_within_group)
                 chainage = gridpoints[gridpoint_index].Chainage
                 item_name = "reach:%s:%s:%.3f" % (quantity.Id, reach.Name, chainage)
 
@@ -90,17 +90,18 @@ class ExtractorTxt(Extractor):
         chainage_format, chainage_formatcs = self.chainage_format, self.chainage_formatcs
 
         f.write(header1_format % "Chainage"),
+        reaches = list(result_data.Reaches)
         for data_entry in output_data:
             data_item = data_entry.data_item
             element_index = data_entry.element_index
 
-            if data_item.ItemTypeGroup != ItemTypeGroup.ReachItem or data_item.IndexList is None:
+            index_list = data_item.IndexList
+            if data_item.ItemTypeGroup != ItemTypeGroup.ReachItem or index_list is None:
                 f.write(header2_format % "-"),
                 continue
 
-            index_list = list(data_item.IndexList)
-            reaches = list(result_data.Reaches)
-            gridpoints = list(reaches[data_item.NumberWithinGroup].GridPoints)
+            number_within_group = data_item.NumberWithinGroup
+            gridpoints = self.get_gridpoints(reaches[number_within_group], number_within_group)
             gridpoint_index = index_list[element_index]
             f.write(chainage_format % System.String.Format(chainage_formatcs, gridpoints[gridpoint_index].Chainage)),
 
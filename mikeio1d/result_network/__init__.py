@@ -1,3 +1,4 @@
+from .data_entry import DataEntry
 from .result_catchment import ResultCatchment
 from .result_catchments import ResultCatchments
 from .result_gridpoint import ResultGridPoint
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -70,12 +71,13 @@ class ResultWriter:
 
         # Pick the first available value.
         # TODO: Some of the query IDs can be not unique. Figure out how to handle this case.
-        values_count = len(values)
-        is_float = isinstance(values[0] if values_count > 0 else 0.0, float)
+        values = np.asarray(values, dtype=np.float32)
+        if values.ndim > 1:
+            values = values[:, 0]
 
-        for i in range(values_count):
-            value = values[i] if is_float else values[i][0]
-            data_item.TimeData.SetValue(i, element_index, value)
+        time_data = data_item.TimeData
+        for i, value in enumerate(values.tolist()):
+            time_data.SetValue(i, element_index, value)
 
     def set_values_indexed(self, time_index, values, data_item, element_index):
         """
@@ -89,7 +91,13 @@ class ResultWriter:
         if isinstance(values, pd.DataFrame):
             values = values.iloc[:, 0]
 
-        for time in time_index:
-            value = values[time]
-            i = res1d_time_index.get_loc(time)
-            data_item.TimeData.SetValue(i, element_index, value)
+        time_step_indices = res1d_time_index.get_indexer(time_index)
+        if (time_step_indices < 0).any():
+            missing_times = time_index[time_step_indices < 0]
+            raise KeyError(f"Times {list(missing_times)} are not present in the result file.")
+
+        values = values.to_numpy(dtype=np.float32)
+
+        time_data = data_item.TimeData
+        for i, value in zip(time_step_indices.tolist(), values.tolist()):
+            time_data.SetValue(i, element_index, value)
@@ -1,7 +1,6 @@
-import numpy as np
-
 from ..custom_exceptions import NoDataForQuery
 from ..custom_exceptions import InvalidQuantity
+from ..dotnet import to_numpy
 from ..various import NAME_DELIMITER
 
 
@@ -35,8 +34,8 @@ class QueryData:
 
     @staticmethod
     def from_dotnet_to_python(array):
-        """Convert .NET array to numpy."""
-        return np.fromiter(array, np.float64)
+        """Convert .NET array to float32 numpy array."""
+        return to_numpy(array)
 
     @property
     def quantity(self):
@@ -1,4 +1,5 @@
 import os
+import datetime
 import pytest
 import numpy as np
 import pandas as pd
@@ -6,6 +7,10 @@ import pandas as pd
 from mikeio1d.custom_exceptions import NoDataForQuery, InvalidQuantity
 from mikeio1d.res1d import Res1D, mike1d_quantities, QueryDataReach, QueryDataNode
 from mikeio1d.dotnet import to_numpy
+from mikeio1d.dotnet import from_dotnet_datetime, from_dotnet_datetimes, to_dotnet_datetime
+from mikeio1d.dotnet import _DOTNET_TICKS_AT_UNIX_EPOCH
+
+import System
 
 
 @pytest.fixture
@@ -58,6 +63,37 @@ def test_repr(test_file):
     assert res1d_repr == res1d_repr_ref
 
 
+def test_header_load_does_not_create_network(test_file_path):
+    res1d = Res1D(test_file_path, header_load=True)
+    assert res1d._result_network is None
+
+    res1d_repr = res1d.__repr__()
+    assert res1d_repr.startswith('<mikeio1d.Res1D>')
+    assert '# Nodes: 119' in res1d_repr
+    assert res1d._result_network is None
+
+
+def test_read_without_queries_reads_all(test_file_path):
+    res1d = Res1D(test_file_path)
+
+    df = res1d.read()
+
+    assert res1d._result_network is None
+    pd.testing.assert_frame_equal(df, res1d.read_all())
+
+
+def test_clear_queries_before_network_access(test_file_path):
+    res1d = Res1D(test_file_path)
+
+    res1d.clear_queries()
+    assert res1d._result_network is None
+
+    res1d.nodes.n_1.WaterLevel.add()
+    assert len(res1d.result_network.queries) == 1
+    res1d.clear_queries()
+    assert len(res1d.result_network.queries) == 0
+
+
 def test_data_item_dicts(test_file):
     res1d = test_file
     assert len(res1d.catchments) == 0
@@ -121,6 +157,161 @@ def test_read_node(test_file, quantity, node_id, expected_max):
     assert pytest.approx(actual_max) == expected_max
 
 
+def test_to_numpy_out(test_file):
+    values_dotnet = test_file.query.GetNodeValues("1", "WaterLevel")
+    data = np.zeros((110, 2), dtype=np.float32, order='F')
+
+    values = to_numpy(values_dotnet, out=data[:, 1])
+
+    assert np.shares_memory(values, data)
+    np.testing.assert_array_equal(data[:, 1], to_numpy(values_dotnet))
+    assert not data[:, 0].any()
+
+
+@pytest.mark.parametrize("out", [
+    np.empty(110, dtype=np.float64),
+    np.empty(109, dtype=np.float32),
+    np.empty((110, 2), dtype=np.float32)[:, 0],
+])
+def test_to_numpy_invalid_out(test_file, out):
+    values_dotnet = test_file.query.GetNodeValues("1", "WaterLevel")
+    with pytest.raises(ValueError):
+        to_numpy(values_dotnet, out=out)
+
+
+def test_to_numpy_double_array():
+    values = np.array([1.5, 2.5, 3.5])
+    data = to_numpy(System.Array[System.Double](values.tolist()))
+    assert data.dtype == np.float64
+    np.testing.assert_array_equal(data, values)
+
+
+def test_to_numpy_unsupported_array():
+    with pytest.raises(NotImplementedError):
+        to_numpy(System.Array[System.Boolean]([True, False]))
+
+
+def test_read_data_entries(test_file):
+    res1d = test_file
+    data_entries = [
+        res1d.nodes.n_1.WaterLevel.get_data_entry(),
+        res1d.nodes.n_2.WaterLevel.get_data_entry(),
+    ]
+
+    data = res1d._read_data_entries(data_entries)
+
+    assert data.shape == (110, 2)
+    assert data.dtype == np.float32
+    np.testing.assert_array_equal(data[:, 0], res1d.get_node_values("1", "WaterLevel"))
+    np.testing.assert_array_equal(data[:, 1], res1d.get_node_values("2", "WaterLevel"))
+
+
+def test_extraction_to_csv_matches_read(test_file, tmp_path):
+    res1d = test_file
+    res1d.clear_queries_after_reading = False
+
+    res1d.nodes.n_1.WaterLevel.add()
+    res1d.nodes.n_2.WaterLevel.add()
+    res1d.reaches.r_9l1.m_5.Discharge.add()
+
+    file_path = str(tmp_path / "Network.extract.csv")
+    res1d.to_csv(file_path)
+    df = res1d.read()
+
+    # Skip the separator, type, quantity, name and chainage header lines.
+    df_csv = pd.read_csv(file_path, sep=";", skiprows=5, header=None, index_col=0, parse_dates=True)
+    df_csv = df_csv.dropna(axis=1, how="all")
+
+    assert df_csv.shape == df.shape
+    np.testing.assert_array_equal(df_csv.index, df.index)
+    np.testing.assert_allclose(df_csv.to_numpy(), df.to_numpy(), rtol=1e-6)
+
+
+@pytest.mark.parametrize("file_name", ["Network.extract.csv", "Network.extract.TXT", "Network.extract.dfs0"])
+def test_extract_file_type_from_extension(test_file, tmp_path, file_name):
+    res1d = test_file
+    res1d.nodes.n_1.WaterLevel.add()
+
+    file_path = str(tmp_path / file_name)
+    res1d.extract(file_path)
+
+    assert os.stat(file_path).st_size > 0
+
+
+def test_extract_unsupported_file_type(test_file, tmp_path):
+    res1d = test_file
+    res1d.nodes.n_1.WaterLevel.add()
+
+    with pytest.raises(ValueError):
+        res1d.extract(str(tmp_path / "Network.extract.xlsx"))
+
+
+def test_dotnet_ticks_at_unix_epoch():
+    assert _DOTNET_TICKS_AT_UNIX_EPOCH == System.DateTime(1970, 1, 1).Ticks
+
+
+def test_from_dotnet_datetimes():
+    times = [
+        System.DateTime(1970, 1, 1),
+        System.DateTime(1994, 8, 7, 16, 35, 0).AddMilliseconds(500),
+        # 12345 ticks is 1234.5 microseconds, which is truncated to 1234 microseconds.
+        System.DateTime(1994, 8, 7, 16, 35, 1).AddTicks(12345),
+    ]
+    expected = np.array([
+        "1970-01-01T00:00:00",
+        "1994-08-07T16:35:00.500",
+        "1994-08-07T16:35:01.001234",
+    ], dtype="datetime64[ns]")
+
+    np.testing.assert_array_equal(from_dotnet_datetimes(times), expected)
+
+    for time, expected_time in zip(times, expected):
+        assert np.datetime64(from_dotnet_datetime(time), "ns") == expected_time
+
+
+def test_dotnet_datetime_round_trip():
+    time = datetime.datetime(1994, 8, 7, 16, 35, 1, 1234)
+    dotnet_time = to_dotnet_datetime(time)
+    assert dotnet_time.Ticks == System.DateTime(1994, 8, 7, 16, 35, 1).AddTicks(12340).Ticks
+    assert from_dotnet_datetime(dotnet_time) == time
+
+
+def test_modify_all_time_steps(test_file_path):
+    res1d = Res1D(test_file_path)
+    query = QueryDataNode("WaterLevel", "1")
+    df = res1d.read(query)
+
+    res1d.modify(df * 2.0)
+
+    df_mod = res1d.read(query)
+    np.testing.assert_allclose(df_mod.to_numpy(), 2.0 * df.to_numpy(), rtol=1e-6)
+
+
+def test_modify_time_steps_subset(test_file_path):
+    res1d = Res1D(test_file_path)
+    query = QueryDataNode("WaterLevel", "1")
+    df = res1d.read(query)
+
+    res1d.modify(df.iloc[10:20] * 2.0)
+
+    expected = df.to_numpy().copy()
+    expected[10:20] *= 2.0
+    df_mod = res1d.read(query)
+    np.testing.assert_allclose(df_mod.to_numpy(), expected, rtol=1e-6)
+
+
+def test_modify_missing_time_step(test_file_path):
+    res1d = Res1D(test_file_path)
+    query = QueryDataNode("WaterLevel", "1")
+    df = res1d.read(query)
+
+    missing_time = df.index[10] + pd.Timedelta(seconds=1)
+    df_missing = pd.DataFrame({str(query): [1.0]}, index=pd.DatetimeIndex([missing_time]))
+
+    with pytest.raises(KeyError):
+        res1d.modify(df_missing)
+
+
 def test_time_index(test_file):
     assert len(test_file.time_index) == 110
 